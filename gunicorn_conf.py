@@ -0,0 +1,7 @@
+import os
+
+# Production server: gunicorn -c gunicorn_conf.py src.api:app
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", str((os.cpu_count() or 1) * 2)))
+keepalive = 65
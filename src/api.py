@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
 from fastapi import Depends, FastAPI, Header, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from pydantic import BaseModel, Field, field_validator
 
-from src.audit.logger import AuditEvent, write_audit_event
+from src.audit.logger import AUDIT_QUEUE_MAXSIZE, AuditEvent, audit_writer_loop, new_event_id
 from src.billing.checkout import create_checkout_for_plan
 from src.billing.plans import PLANS
 from src.billing.provisioning import apply_square_subscription_update, provision_user
@@ -25,7 +27,7 @@ from src.planner import build_plan
 from src.repositories.api_keys import get_api_key_for_user
 from src.repositories.usage import get_monthly_usage_count, record_usage_event
 from src.repositories.users import get_user_by_email
-from src.router import route_intent
+from src.router import UserText, route_intent
 from src.tools.sql_generator import generate_safe_sql
 from src.config import settings
 
@@ -40,10 +42,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _orjson_response(content: Dict[str, Any]) -> Response:
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
     init_db()
-    yield
+    audit_queue: asyncio.Queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+    writer = asyncio.create_task(
+        audit_writer_loop(audit_queue, audit_dir=settings.audit_dir, fsync=settings.audit_fsync)
+    )
+    app.state.audit_queue = audit_queue
+    app.state.audit_writer = writer
+    try:
+        yield
+    finally:
+        # Flush pending audit events before shutdown
+        if not writer.done():
+            await audit_queue.join()
+        writer.cancel()
+        try:
+            await writer
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Audit writer exited with an error")
 
 
 app = FastAPI(
@@ -68,6 +92,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Small responses (/health, /) skip compression; larger plan payloads get gzipped
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.exception_handler(AppError)
 async def handle_app_error(request: Request, exc: AppError):
@@ -80,20 +107,46 @@ async def handle_unexpected_error(request: Request, exc: Exception):
     return await unhandled_error_handler(request, exc)
 
 
-@app.middleware("http")
-async def add_service_headers_and_log(request: Request, call_next):
-    start = time.perf_counter()
-    response = await call_next(request)
-    duration_ms = round((time.perf_counter() - start) * 1000, 2)
-    response.headers["X-Service-Name"] = "enterprise-ai-ops"
-    logger.info(
-        "request_complete path=%s method=%s status=%s duration_ms=%s",
-        request.url.path,
-        request.method,
-        response.status_code,
-        duration_ms,
-    )
-    return response
+class ServiceHeaderMiddleware:
+    """
+    Pure ASGI middleware: adds X-Service-Name and logs request timing without
+    BaseHTTPMiddleware's per-request task and stream overhead.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = None
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-service-name", b"enterprise-ai-ops")
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = round((time.perf_counter() - start) * 1000, 2)
+            logger.info(
+                "request_complete path=%s method=%s status=%s duration_ms=%s",
+                scope["path"],
+                scope["method"],
+                status_code,
+                duration_ms,
+            )
+
+
+app.add_middleware(ServiceHeaderMiddleware)
 
 
 class RootResponse(BaseModel):
@@ -241,7 +294,7 @@ class AccessRetrieveResponse(BaseModel):
 
 
 @app.api_route("/", methods=["GET", "HEAD"], response_model=RootResponse, tags=["Service"])
-def root() -> RootResponse:
+async def root() -> RootResponse:
     return RootResponse(
         service="enterprise-ai-ops",
         docs="/docs",
@@ -255,7 +308,7 @@ def root() -> RootResponse:
 
 
 @app.api_route("/health", methods=["GET", "HEAD"], response_model=HealthResponse, tags=["Service"])
-def health() -> HealthResponse:
+async def health() -> HealthResponse:
     return HealthResponse(status="ok", app=APP_NAME, env=APP_ENV)
 
 
@@ -271,53 +324,67 @@ def access_page() -> HTMLResponse:
     return HTMLResponse(access_path.read_text(encoding="utf-8"))
 
 
-@app.post("/plan", response_model=PlanResponse, response_model_exclude_none=True, tags=["Planning"])
-def plan_endpoint(req: PlanRequest, auth: AuthContext = Depends(require_api_key)) -> PlanResponse:
-    user_text = req.text.strip()
-    redaction = redact_sensitive(user_text)
+@app.post(
+    "/plan",
+    response_model=None,
+    responses={200: {"model": PlanResponse, "description": "Successful Response"}},
+    tags=["Planning"],
+)
+async def plan_endpoint(
+    req: PlanRequest,
+    request: Request,
+    auth: AuthContext = Depends(require_api_key),
+) -> Response:
+    user_text = UserText.of(req.text.strip())
+    redaction = redact_sensitive(user_text.raw)
     route = route_intent(user_text)
-    plan = build_plan(route, user_text)
+    now_ns = time.time_ns()
+    plan = build_plan(route, user_text, now_ns=now_ns)
+    plan_dict = plan.to_dict()
 
     sql_payload = None
     if plan.intent == "QUERY":
         sql_output = generate_safe_sql(user_text=user_text, schema_name=req.schema_name)
-        sql_payload = {
-            "dialect": getattr(sql_output, "dialect", "sqlserver"),
-            "query": sql_output.query,
-            "assumptions": sql_output.assumptions,
-            "safety_notes": sql_output.safety_notes,
-            "suggested_next_inputs": sql_output.suggested_next_inputs,
-        }
+        sql_payload = sql_output.to_dict()
 
     audit_id = None
     if req.audit:
-        audit_id = f"audit_{int(datetime.now().timestamp())}"
+        audit_id = new_event_id(now_ns)
         event = AuditEvent(
             event_id=audit_id,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=plan.created_at,
             redacted_input=redaction.redacted_text,
             route={
                 "intent": route.intent.value,
                 "confidence": route.confidence,
                 "rationale": route.rationale,
             },
-            plan=plan.to_dict(),
+            plan=plan_dict,
             redaction_counts=redaction.redaction_counts,
             sql=sql_payload,
         )
-        write_audit_event(event, audit_dir="audit")
-
-    return PlanResponse(
-        route={
+        # No writer when lifespan did not run (e.g. --lifespan off)
+        writer = getattr(request.app.state, "audit_writer", None)
+        if writer is None or writer.done():
+            raise AppError("audit_unavailable", "Audit log writer is not running.", status_code=503)
+        await request.app.state.audit_queue.put(event.to_dict())
+
+    # PlanResponse is documented in OpenAPI only; the body is already JSON-ready, so
+    # encode it with orjson and skip validation. Optional keys are omitted when None.
+    content: Dict[str, Any] = {
+        "route": {
             "intent": route.intent.value,
             "confidence": route.confidence,
             "rationale": route.rationale,
         },
-        plan=plan.to_dict(),
-        sql=sql_payload,
-        audit_id=audit_id,
-        requester_plan=auth.plan,
-    )
+        "plan": plan_dict,
+        "requester_plan": auth.plan,
+    }
+    if sql_payload is not None:
+        content["sql"] = sql_payload
+    if audit_id is not None:
+        content["audit_id"] = audit_id
+    return _orjson_response(content)
 
 
 @app.post("/v1/sql/generate", response_model=SQLGenerateResponse, tags=["SQL"])
@@ -348,11 +415,7 @@ def generate_sql_endpoint(
     risk_level = "LOW" if req.schema_name is not None else "MEDIUM"
 
     return SQLGenerateResponse(
-        dialect=getattr(sql_output, "dialect", "sqlserver"),
-        query=sql_output.query,
-        assumptions=sql_output.assumptions,
-        safety_notes=sql_output.safety_notes,
-        suggested_next_inputs=sql_output.suggested_next_inputs,
+        **sql_output.to_dict(),
         plan=auth.plan,
         risk_level=risk_level,
     )
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import itertools
+import logging
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Bounds memory if the writer falls behind; producers wait once it is full
+AUDIT_QUEUE_MAXSIZE = 10_000
+
 
 @dataclass
 class AuditEvent:
@@ -17,10 +26,102 @@ class AuditEvent:
     redaction_counts: Dict[str, int]
     sql: Optional[Dict[str, Any]] = None  # ✅ NEW
 
+    def to_dict(self) -> Dict[str, Any]:
+        # Flat build; dataclasses.asdict would deep-copy already-plain data
+        return {
+            "event_id": self.event_id,
+            "timestamp": self.timestamp,
+            "redacted_input": self.redacted_input,
+            "route": self.route,
+            "plan": self.plan,
+            "redaction_counts": self.redaction_counts,
+            "sql": self.sql,
+        }
+
+
+# Disambiguates events created in the same nanosecond within this process
+_EVENT_SEQ = itertools.count()
+
+
+def new_event_id(now_ns: int) -> str:
+    return f"audit_{now_ns}_{next(_EVENT_SEQ)}"
+
+
+def audit_log_path(audit_dir: str = "audit") -> str:
+    """
+    Append-only JSONL audit log, rotated daily (UTC): audit/audit-YYYYMMDD.jsonl
+    """
+    day = datetime.now(timezone.utc).strftime("%Y%m%d")
+    return os.path.join(audit_dir, f"audit-{day}.jsonl")
+
 
 def write_audit_event(event: AuditEvent, audit_dir: str = "audit") -> str:
     os.makedirs(audit_dir, exist_ok=True)
-    path = os.path.join(audit_dir, f"{event.event_id}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(asdict(event), f, indent=2, ensure_ascii=False)
-    return path
\ No newline at end of file
+    path = audit_log_path(audit_dir)
+    with open(path, "ab") as f:
+        f.write(orjson.dumps(event.to_dict()) + b"\n")
+    return path
+
+
+async def audit_writer_loop(queue: asyncio.Queue, audit_dir: str = "audit", fsync: bool = False) -> None:
+    """
+    Drains queued audit event dicts into the append-only JSONL audit log.
+    Everything pending when the writer wakes up goes out as one batch (one write call).
+    Write failures are logged and the batch is dropped; the loop keeps running and
+    reopens the log on the next batch.
+    """
+    path = None
+    fd = -1
+    try:
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                # Reopen when the day rolls over so each day gets its own file
+                current = audit_log_path(audit_dir)
+                if current != path:
+                    fd = _close(fd)
+                    path = None
+                    os.makedirs(audit_dir, exist_ok=True)
+                    fd = os.open(current, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    path = current
+
+                data = b"".join(orjson.dumps(e) + b"\n" for e in batch)
+                await asyncio.to_thread(_append, fd, data, fsync)
+            except Exception:
+                logger.exception(
+                    "audit_write_failed dropped_events=%s audit_dir=%s",
+                    len(batch),
+                    audit_dir,
+                )
+                fd = _close(fd)
+                path = None
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    finally:
+        _close(fd)
+
+
+def _append(fd: int, data: bytes, fsync: bool) -> None:
+    # os.write may return a short count; keep going so no JSONL line is truncated
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+    if fsync:
+        os.fsync(fd)
+
+
+def _close(fd: int) -> int:
+    if fd >= 0:
+        try:
+            os.close(fd)
+        except OSError:
+            logger.exception("audit_close_failed")
+    return -1
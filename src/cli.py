@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import argparse
-from datetime import datetime, timezone
+import sys
+import time
 
-from .router import route_intent
+import orjson
+
+from .router import UserText, route_intent
 from .planner import build_plan
 from .governance.redact import redact_sensitive
-from .audit.logger import AuditEvent, write_audit_event
+from .audit.logger import AuditEvent, new_event_id, write_audit_event
 
 
 def main(argv=None) -> int:
@@ -17,7 +20,7 @@ def main(argv=None) -> int:
     parser.add_argument("text", nargs="*", help="User request text")
     parser.add_argument("--no-audit", action="store_true", help="Disable writing audit logs")
     parser.add_argument("--audit-dir", default="audit", help="Directory to write audit logs")
-    parser.add_argument("--json", action="store_true", help="Output plan as JSON-like dict")
+    parser.add_argument("--json", action="store_true", help="Output plan as JSON")
 
     # Schema-aware SQL planning
     parser.add_argument("--schema", default=None, help="Path to a JSON schema file used for SQL planning")
@@ -32,29 +35,29 @@ def main(argv=None) -> int:
     # Governance-first: redact before logging
     redaction = redact_sensitive(user_text)
 
-    # Route + plan
-    route = route_intent(user_text)
-    plan = build_plan(route, user_text)
+    # Route + plan (lowercase once, shared downstream)
+    text = UserText.of(user_text)
+    route = route_intent(text)
+    now_ns = time.time_ns()
+    plan = build_plan(route, text, now_ns=now_ns)
 
     # Optional: SQL generation for QUERY intent
     sql_output = None
+    sql_payload = None
     if plan.intent == "QUERY":
         from .tools.sql_generator import generate_safe_sql
 
-        sql_output = generate_safe_sql(user_text, schema_path=args.schema)
+        sql_output = generate_safe_sql(text, schema_path=args.schema)
+        sql_payload = sql_output.to_dict()
 
     # Print output
     if args.json:
         out = {"plan": plan.to_dict()}
-        if sql_output:
-            out["sql"] = {
-                "dialect": getattr(sql_output, "dialect", "sqlserver"),
-                "query": sql_output.query,
-                "assumptions": sql_output.assumptions,
-                "safety_notes": sql_output.safety_notes,
-                "suggested_next_inputs": sql_output.suggested_next_inputs,
-            }
-        print(out)
+        if sql_payload:
+            out["sql"] = sql_payload
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(out, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
     else:
         print(f"\nIntent: {plan.intent} (confidence={plan.confidence:.2f})")
         if plan.risk_flags:
@@ -93,22 +96,11 @@ def main(argv=None) -> int:
 
     # Audit log (logs plan + optional SQL artifact)
     if not args.no_audit:
-        event_id = f"audit_{int(datetime.now().timestamp())}"
-
-        # Include SQL artifact in audit log if it exists
-        sql_payload = None
-        if sql_output:
-            sql_payload = {
-                "dialect": getattr(sql_output, "dialect", "sqlserver"),
-                "query": sql_output.query,
-                "assumptions": sql_output.assumptions,
-                "safety_notes": sql_output.safety_notes,
-                "suggested_next_inputs": sql_output.suggested_next_inputs,
-            }
+        event_id = new_event_id(now_ns)
 
         event = AuditEvent(
             event_id=event_id,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=plan.created_at,
             redacted_input=redaction.redacted_text,
             route={"intent": route.intent.value, "confidence": route.confidence, "rationale": route.rationale},
             plan=plan.to_dict(),
@@ -116,7 +108,8 @@ def main(argv=None) -> int:
             sql=sql_payload,  # Requires AuditEvent to include sql: Optional[Dict[str, Any]] = None
         )
         path = write_audit_event(event, audit_dir=args.audit_dir)
-        print(f"Audit log written: {path}")
+        # Keep stdout pure JSON in --json mode
+        print(f"Audit log written: {path}", file=sys.stderr if args.json else sys.stdout)
 
     return 0
 
@@ -32,6 +32,8 @@ class Settings:
     log_level: str
     require_api_key: bool
     app_db_path: str
+    audit_dir: str
+    audit_fsync: bool
 
     individual_api_key: str
     company_api_key: str
@@ -67,6 +69,8 @@ settings = Settings(
     log_level=os.getenv("LOG_LEVEL", "INFO"),
     require_api_key=_as_bool(os.getenv("REQUIRE_API_KEY"), default=True),
     app_db_path=os.getenv("APP_DB_PATH", "data/app.db"),
+    audit_dir=os.getenv("AUDIT_DIR", "audit"),
+    audit_fsync=_as_bool(os.getenv("AUDIT_FSYNC"), default=False),
 
     individual_api_key=_required("INDIVIDUAL_API_KEY", test_default="test-individual-key"),
     company_api_key=_required("COMPANY_API_KEY", test_default="test-company-key"),
@@ -1,13 +1,61 @@
 from __future__ import annotations
 
-import re
+import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Tuple
 
+import re2
 
-_EMAIL_RE = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
-_PHONE_RE = re.compile(r"\b(\+?1[-.\s]?)?(\(?\d{3}\)?[-.\s]?)\d{3}[-.\s]?\d{4}\b")
-_SSN_RE = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+
+# Single alternation so the text is scanned once; group order keeps the
+# original email -> phone -> ssn precedence. RE2 matches in linear time,
+# so long pasted documents cannot trigger backtracking blowups.
+# Phone separators spell out Python's ASCII \s (RE2's \s lacks \v and \x1c-\x1f).
+_SENSITIVE_RE = re2.compile(
+    r"(?i)"
+    r"(?P<email>\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b)"
+    r"|(?P<phone>\b(\+?1[-.\t\n\v\f\r \x1c-\x1f]?)?(\(?\p{Nd}{3}\)?[-.\t\n\v\f\r \x1c-\x1f]?)"
+    r"\p{Nd}{3}[-.\t\n\v\f\r \x1c-\x1f]?\p{Nd}{4}\b)"
+    r"|(?P<ssn>\b\p{Nd}{3}-\p{Nd}{2}-\p{Nd}{4}\b)"
+)
+
+
+class _MatchFold:
+    """
+    str.translate table for the copy of the text that RE2 scans. RE2's \\b and \\s
+    are ASCII-only, while Python's re treats any Unicode letter/digit as a word
+    character and any Unicode space as whitespace. Folding Unicode digits to
+    ASCII digits, other word characters to "a" and whitespace to " " restores
+    those semantics. Each code point maps to exactly one code point, so match
+    offsets line up with the original text.
+    """
+
+    def __getitem__(self, cp: int) -> int:
+        return _fold_code_point(cp)
+
+
+@lru_cache(maxsize=4096)
+def _fold_code_point(cp: int) -> int:
+    # Bounded: request text is user-controlled and could touch any code point
+    ch = chr(cp)
+    digit = unicodedata.decimal(ch, None)
+    if digit is not None:
+        return ord("0") + digit
+    if ch.isspace():
+        return ord(" ")
+    if ch.isalnum():
+        return ord("a")
+    return cp
+
+
+_MATCH_FOLD = _MatchFold()
+
+_REPLACEMENTS = {
+    "email": "[REDACTED_EMAIL]",
+    "phone": "[REDACTED_PHONE]",
+    "ssn": "[REDACTED_SSN]",
+}
 
 
 @dataclass(frozen=True)
@@ -20,16 +68,25 @@ def redact_sensitive(text: str) -> RedactionResult:
     """
     Basic redaction for MVP. Keeps logs safer by default.
     """
-    counts = {"email": 0, "phone": 0, "ssn": 0}
-    out = text or ""
+    out, (email, phone, ssn) = _redact_cached(text or "")
+    return RedactionResult(out, {"email": email, "phone": phone, "ssn": ssn})
 
-    out, n = _EMAIL_RE.subn("[REDACTED_EMAIL]", out)
-    counts["email"] += n
 
-    out, n = _PHONE_RE.subn("[REDACTED_PHONE]", out)
-    counts["phone"] += n
+@lru_cache(maxsize=1024)
+def _redact_cached(text: str) -> Tuple[str, Tuple[int, int, int]]:
+    # Repeated prompts skip the scan; counts come back as a tuple so callers
+    # always get a fresh dict they can't use to corrupt the cache.
+    counts = {"email": 0, "phone": 0, "ssn": 0}
+    scanned = text if text.isascii() else text.translate(_MATCH_FOLD)
 
-    out, n = _SSN_RE.subn("[REDACTED_SSN]", out)
-    counts["ssn"] += n
+    parts = []
+    pos = 0
+    for m in _SENSITIVE_RE.finditer(scanned):
+        kind = m.lastgroup
+        counts[kind] += 1
+        parts.append(text[pos:m.start()])
+        parts.append(_REPLACEMENTS[kind])
+        pos = m.end()
+    parts.append(text[pos:])
 
-    return RedactionResult(out, counts)
\ No newline at end of file
+    return "".join(parts), (counts["email"], counts["phone"], counts["ssn"])
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+import itertools
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from .router import Intent, RouteResult
+from .router import Intent, RouteResult, UserText
+
+# Disambiguates plans built in the same nanosecond within this process
+_PLAN_SEQ = itertools.count()
 
 
 @dataclass
@@ -20,15 +25,29 @@ class Plan:
     output_format: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat build; dataclasses.asdict would deep-copy already-plain data
+        return {
+            "plan_id": self.plan_id,
+            "created_at": self.created_at,
+            "intent": self.intent,
+            "confidence": self.confidence,
+            "assumptions": self.assumptions,
+            "steps": self.steps,
+            "required_inputs": self.required_inputs,
+            "risk_flags": self.risk_flags,
+            "output_format": self.output_format,
+        }
 
 
-def build_plan(route: RouteResult, user_text: str) -> Plan:
+def build_plan(route: RouteResult, user_text: Union[str, UserText], now_ns: Optional[int] = None) -> Plan:
     """
     Produces an auditable plan (not just an answer). This is a core enterprise signal.
+    `now_ns` is an epoch time in nanoseconds; callers pass the one they reuse for the audit event.
     """
-    now = datetime.now(timezone.utc).isoformat()
-    plan_id = f"plan_{int(datetime.now().timestamp())}"
+    if now_ns is None:
+        now_ns = time.time_ns()
+    created_at = datetime.fromtimestamp(now_ns / 1e9, timezone.utc).isoformat()
+    plan_id = f"plan_{now_ns}_{next(_PLAN_SEQ)}"
 
     assumptions: List[str] = []
     steps: List[str] = []
@@ -36,7 +55,7 @@ def build_plan(route: RouteResult, user_text: str) -> Plan:
     risk_flags: List[str] = []
 
     # Very lightweight risk heuristics (MVP)
-    lowered = (user_text or "").lower()
+    lowered = user_text.lower if isinstance(user_text, UserText) else (user_text or "").lower()
     if any(k in lowered for k in ["ssn", "social security", "password", "dob", "date of birth"]):
         risk_flags.append("POTENTIAL_PII")
 
@@ -104,7 +123,7 @@ def build_plan(route: RouteResult, user_text: str) -> Plan:
 
     return Plan(
         plan_id=plan_id,
-        created_at=now,
+        created_at=created_at,
         intent=route.intent.value,
         confidence=route.confidence,
         assumptions=assumptions,
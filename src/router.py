@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+import ahocorasick
 
 
 class Intent(str, Enum):
@@ -13,6 +16,22 @@ class Intent(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+@dataclass(frozen=True)
+class UserText:
+    """
+    Request text plus its lowercased form, computed once and shared by the
+    router, planner and SQL generator.
+    """
+
+    raw: str
+    lower: str
+
+    @classmethod
+    def of(cls, text: Optional[str]) -> UserText:
+        raw = text or ""
+        return cls(raw, raw.lower())
+
+
 @dataclass(frozen=True)
 class RouteResult:
     intent: Intent
@@ -20,37 +39,52 @@ class RouteResult:
     rationale: str
 
 
-def route_intent(user_text: str) -> RouteResult:
+_INTENT_KEYWORDS: Dict[Intent, Tuple[str, ...]] = {
+    Intent.QUERY: ("select", "sql", "query", "report", "table", "join", "where", "count", "list"),
+    Intent.VALIDATE: ("validate", "check", "verify", "rule", "constraint", "policy", "compliance", "edge case"),
+    Intent.SUMMARIZE: ("summarize", "summary", "tl;dr", "recap", "shorten"),
+    Intent.EXPLAIN: ("explain", "why", "how", "walk me through", "reason", "rationale"),
+}
+
+
+# Counter slot per scored intent; max() over slots keeps this order as the tie-break
+_SCORED_INTENTS: Tuple[Intent, ...] = tuple(_INTENT_KEYWORDS)
+
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for slot, intent in enumerate(_SCORED_INTENTS):
+        for kw in _INTENT_KEYWORDS[intent]:
+            automaton.add_word(kw, (kw, slot))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import; route_intent scans the text a single time regardless of keyword count
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+@lru_cache(maxsize=1024)
+def route_intent(user_text: Union[str, UserText]) -> RouteResult:
     """
     Lightweight, deterministic router for the MVP.
     We keep it simple and auditable. This can later be replaced with an LLM router.
+    Results are memoized per input text (RouteResult is immutable); see route_intent.cache_info().
     """
-    text = (user_text or "").strip().lower()
+    ut = user_text if isinstance(user_text, UserText) else UserText.of(user_text)
+    text = ut.lower.strip()
     if not text:
         return RouteResult(Intent.UNKNOWN, 0.0, "Empty input")
 
-    query_terms = ("select", "sql", "query", "report", "table", "join", "where", "count", "list")
-    validate_terms = ("validate", "check", "verify", "rule", "constraint", "policy", "compliance", "edge case")
-    summarize_terms = ("summarize", "summary", "tl;dr", "recap", "shorten")
-    explain_terms = ("explain", "why", "how", "walk me through", "reason", "rationale")
-
-    # Simple scoring
-    score = {Intent.QUERY: 0, Intent.VALIDATE: 0, Intent.SUMMARIZE: 0, Intent.EXPLAIN: 0}
-    for t in query_terms:
-        if t in text:
-            score[Intent.QUERY] += 1
-    for t in validate_terms:
-        if t in text:
-            score[Intent.VALIDATE] += 1
-    for t in summarize_terms:
-        if t in text:
-            score[Intent.SUMMARIZE] += 1
-    for t in explain_terms:
-        if t in text:
-            score[Intent.EXPLAIN] += 1
-
-    best_intent = max(score, key=score.get)
-    best_score = score[best_intent]
+    # Simple scoring: each distinct keyword counts once toward its intent
+    matched = dict(hit for _, hit in _KEYWORD_AUTOMATON.iter(text))
+    score = [0] * len(_SCORED_INTENTS)
+    for slot in matched.values():
+        score[slot] += 1
+
+    best_slot = max(range(len(score)), key=score.__getitem__)
+    best_intent = _SCORED_INTENTS[best_slot]
+    best_score = score[best_slot]
 
     if best_score == 0:
         # Default behavior: EXPLAIN is usually safest for generic prompts
@@ -1,6 +1,11 @@
+from dataclasses import replace
+
+import orjson
 from fastapi.testclient import TestClient
 
+import src.api as api_module
 from src.api import app
+from src.audit.logger import audit_log_path
 from src.db.seed_dev_data import seed
 
 
@@ -11,6 +16,12 @@ def test_health():
         assert response.json()["status"] == "ok"
 
 
+def test_service_header_added():
+    with TestClient(app) as client:
+        response = client.get("/")
+        assert response.headers["x-service-name"] == "enterprise-ai-ops"
+
+
 def test_generate_sql_requires_api_key():
     with TestClient(app) as client:
         response = client.post(
@@ -70,4 +81,75 @@ def test_company_plan_limit_enforced():
                 "schema_name": "hr_demo",
             },
         )
-        assert response.status_code == 400
\ No newline at end of file
+        assert response.status_code == 400
+
+
+def test_plan_returns_sql_for_query_intent():
+    seed()
+    with TestClient(app) as client:
+        response = client.post(
+            "/plan",
+            headers={"X-API-Key": "dev-individual-key"},
+            json={
+                "text": "Generate a SQL query to list active employees",
+                "schema_name": "hr_demo",
+                "audit": False,
+            },
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["route"]["intent"] == "QUERY"
+        assert body["requester_plan"] == "individual"
+        assert "FROM dbo.Employees" in body["sql"]["query"]
+        assert "audit_id" not in body
+
+
+def test_generate_sql_past_90_days_adds_date_filter():
+    seed()
+    with TestClient(app) as client:
+        response = client.post(
+            "/v1/sql/generate",
+            headers={"X-API-Key": "dev-individual-key"},
+            json={
+                "user_text": "Show active employees hired in the past 90 days",
+                "top_n": 25,
+                "schema_name": "hr_demo",
+            },
+        )
+        assert response.status_code == 200
+        query = response.json()["query"]
+        assert "WHERE Status = 'ACTIVE' AND HireDate >= DATEADD(DAY, -90, GETDATE())" in query
+
+
+def test_plan_audit_event_written_to_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_module, "settings", replace(api_module.settings, audit_dir=str(tmp_path)))
+    seed()
+    with TestClient(app) as client:
+        response = client.post(
+            "/plan",
+            headers={"X-API-Key": "dev-individual-key"},
+            json={"text": "Generate a SQL query to list active employees", "schema_name": "hr_demo"},
+        )
+        assert response.status_code == 200
+        audit_id = response.json()["audit_id"]
+
+    # Leaving the client runs the lifespan shutdown, which flushes the queue
+    with open(audit_log_path(str(tmp_path)), "rb") as f:
+        events = [orjson.loads(line) for line in f]
+    assert [e["event_id"] for e in events] == [audit_id]
+    assert "FROM dbo.Employees" in events[0]["sql"]["query"]
+
+
+def test_plan_audit_unavailable_without_writer(monkeypatch):
+    seed()
+    # Without the context manager the lifespan never starts the audit writer;
+    # drop any writer left on app.state by earlier tests
+    monkeypatch.delattr(app.state, "audit_writer", raising=False)
+    client = TestClient(app)
+    response = client.post(
+        "/plan",
+        headers={"X-API-Key": "dev-individual-key"},
+        json={"text": "Generate a SQL query to list active employees"},
+    )
+    assert response.status_code == 503
+    assert response.json()["error"] == "audit_unavailable"
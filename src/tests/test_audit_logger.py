@@ -0,0 +1,59 @@
+import asyncio
+
+import orjson
+
+from src.audit.logger import AuditEvent, audit_log_path, audit_writer_loop, new_event_id, write_audit_event
+
+
+def test_audit_writer_loop_appends_jsonl(tmp_path):
+    async def run() -> None:
+        queue: asyncio.Queue = asyncio.Queue()
+        writer = asyncio.create_task(audit_writer_loop(queue, audit_dir=str(tmp_path)))
+        for i in range(3):
+            queue.put_nowait({"event_id": f"audit_{i}"})
+        await queue.join()
+        writer.cancel()
+
+    asyncio.run(run())
+
+    with open(audit_log_path(str(tmp_path)), "rb") as f:
+        lines = f.read().splitlines()
+    assert [orjson.loads(line)["event_id"] for line in lines] == ["audit_0", "audit_1", "audit_2"]
+
+
+def test_audit_writer_loop_survives_write_errors(tmp_path):
+    # A regular file where the audit directory should be makes every write fail
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+
+    async def run() -> bool:
+        queue: asyncio.Queue = asyncio.Queue()
+        writer = asyncio.create_task(audit_writer_loop(queue, audit_dir=str(blocker / "audit")))
+        queue.put_nowait({"event_id": "audit_0"})
+        await queue.join()
+        alive = not writer.done()
+        writer.cancel()
+        return alive
+
+    assert asyncio.run(run())
+
+
+def test_new_event_id_unique_within_same_timestamp():
+    assert new_event_id(1700000000000000000) != new_event_id(1700000000000000000)
+
+
+def test_write_audit_event_appends_to_daily_log(tmp_path):
+    for event_id in ("audit_a", "audit_b"):
+        event = AuditEvent(
+            event_id=event_id,
+            timestamp="2026-01-01T00:00:00+00:00",
+            redacted_input="list employees",
+            route={},
+            plan={},
+            redaction_counts={},
+        )
+        path = write_audit_event(event, audit_dir=str(tmp_path))
+
+    assert path == audit_log_path(str(tmp_path))
+    with open(path, "rb") as f:
+        assert [orjson.loads(line)["event_id"] for line in f] == ["audit_a", "audit_b"]
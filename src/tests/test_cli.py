@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import orjson
+
+from src.cli import main
+
+EXAMPLE_SCHEMA = Path(__file__).resolve().parents[2] / "examples" / "schema_ps.json"
+
+
+def test_cli_json_output_is_valid_json(capsys):
+    exit_code = main(["--no-audit", "--json", "list active employees"])
+    assert exit_code == 0
+
+    out = orjson.loads(capsys.readouterr().out)
+    assert out["plan"]["intent"] == "QUERY"
+    assert out["sql"]["dialect"] == "sqlserver"
+
+
+def test_cli_json_output_stays_valid_with_audit(tmp_path, capsys):
+    exit_code = main(["--json", "--audit-dir", str(tmp_path), "list active employees"])
+    assert exit_code == 0
+
+    captured = capsys.readouterr()
+    assert orjson.loads(captured.out)["plan"]["intent"] == "QUERY"
+    assert "Audit log written" in captured.err
+
+
+def test_cli_schema_file_drives_table_choice(capsys):
+    exit_code = main(["--no-audit", "--json", "--schema", str(EXAMPLE_SCHEMA), "list active departments"])
+    assert exit_code == 0
+
+    sql = orjson.loads(capsys.readouterr().out)["sql"]
+    assert "FROM dbo.Departments" in sql["query"]
+    assert f"Schema used: {EXAMPLE_SCHEMA}" in sql["assumptions"]
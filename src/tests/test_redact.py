@@ -0,0 +1,40 @@
+from src.governance.redact import _fold_code_point, redact_sensitive
+
+
+def test_redact_sensitive_counts_each_kind():
+    result = redact_sensitive("Email jane.doe@corp.com, call 555-123-4567, SSN 123-45-6789.")
+    assert result.redacted_text == "Email [REDACTED_EMAIL], call [REDACTED_PHONE], SSN [REDACTED_SSN]."
+    assert result.redaction_counts == {"email": 1, "phone": 1, "ssn": 1}
+
+
+def test_redact_sensitive_leaves_clean_text():
+    result = redact_sensitive("list active employees")
+    assert result.redacted_text == "list active employees"
+    assert result.redaction_counts == {"email": 0, "phone": 0, "ssn": 0}
+
+
+def test_redact_sensitive_non_ascii_digits():
+    result = redact_sensitive("SSN １２３-４５-６７８９, call ５５５-１２３-４５６７ or ٥٥٥-١٢٣-٤٥٦٧")
+    assert result.redacted_text == "SSN [REDACTED_SSN], call [REDACTED_PHONE] or [REDACTED_PHONE]"
+    assert result.redaction_counts == {"email": 0, "phone": 2, "ssn": 1}
+
+
+def test_redact_sensitive_unicode_word_boundaries():
+    # Ideographic space is whitespace and a word boundary, as with Python's re
+    assert redact_sensitive("番号　123-45-6789").redacted_text == "番号　[REDACTED_SSN]"
+    # A non-ASCII letter glued to the digits is part of the same word: no boundary, no match
+    assert redact_sensitive("é123-45-6789").redaction_counts["ssn"] == 0
+
+
+def test_redact_sensitive_ascii_control_separators():
+    # Python's \s also covers \v and \x1c-\x1f; RE2's does not
+    for sep in ("\v", "\x1c", "\x1f"):
+        result = redact_sensitive(f"phone 555{sep}123{sep}4567")
+        assert result.redacted_text == "phone [REDACTED_PHONE]"
+        assert result.redaction_counts["phone"] == 1
+
+
+def test_unicode_fold_cache_is_bounded():
+    redact_sensitive("".join(chr(cp) for cp in range(0x4E00, 0x4E00 + 10000)))
+    info = _fold_code_point.cache_info()
+    assert info.currsize <= info.maxsize
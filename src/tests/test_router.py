@@ -0,0 +1,25 @@
+import pytest
+
+from src.router import Intent, UserText, route_intent
+
+
+def test_route_intent_query_keywords():
+    result = route_intent("Generate a SQL query to list active employees")
+    assert result.intent == Intent.QUERY
+    assert result.confidence == pytest.approx(0.9)
+
+
+def test_route_intent_multi_word_keyword():
+    result = route_intent("Walk me through the edge case policy")
+    assert result.intent == Intent.VALIDATE
+
+
+def test_route_intent_defaults_to_explain():
+    result = route_intent("hello there")
+    assert result.intent == Intent.EXPLAIN
+    assert result.confidence == 0.35
+
+
+def test_route_intent_accepts_user_text():
+    text = "Summarize the quarterly recap"
+    assert route_intent(UserText.of(text)) == route_intent(text)
@@ -0,0 +1,49 @@
+import os
+
+import orjson
+
+from src.tools.sql_generator import _load_schema_file, _load_schema_file_cached, generate_safe_sql
+
+
+def _write_schema(path, tables, mtime_ns):
+    path.write_bytes(orjson.dumps({"tables": tables}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_schema_file_reparsed_when_mtime_changes(tmp_path):
+    schema_file = tmp_path / "schema.json"
+    _write_schema(schema_file, {"dbo.Employees": ["EmployeeID", "Status"]}, 1_700_000_000_000_000_000)
+
+    first = generate_safe_sql("list employees", schema_path=str(schema_file))
+    assert "EmployeeID" in first.query
+
+    hits = _load_schema_file_cached.cache_info().hits
+    generate_safe_sql("list employees", schema_path=str(schema_file))
+    assert _load_schema_file_cached.cache_info().hits == hits + 1
+
+    _write_schema(schema_file, {"dbo.Employees": ["WorkerID", "Status"]}, 1_700_000_001_000_000_000)
+    second = generate_safe_sql("list employees", schema_path=str(schema_file))
+    assert "WorkerID" in second.query
+    assert "EmployeeID" not in second.query
+
+
+def test_schema_file_without_status_or_with_wide_table(tmp_path):
+    wide_cols = [f"Col{i:02d}" for i in range(14)] + ["SSN", "Salary", "TerminationDate"]
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_bytes(orjson.dumps({"tables": {
+        "dbo.Employees": wide_cols,
+        "dbo.Departments": ["DepartmentID", "DepartmentName"],
+    }}))
+
+    schema = _load_schema_file(str(schema_file))
+    assert schema["status_col"] == {"dbo.Employees": None, "dbo.Departments": None}
+    assert schema["date_col"] == {"dbo.Employees": "TerminationDate", "dbo.Departments": None}
+    assert schema["cols_safe"]["dbo.Employees"] == wide_cols[:12]
+
+    plan = generate_safe_sql("list active employees in the last 90 days", schema_path=str(schema_file))
+    assert "Status" not in plan.query
+    assert "SSN" not in plan.query and "Salary" not in plan.query
+    assert "TerminationDate >= DATEADD(DAY, -90, GETDATE())" in plan.query
+
+    plan = generate_safe_sql("list active departments", schema_path=str(schema_file))
+    assert "WHERE" not in plan.query
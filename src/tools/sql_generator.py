@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import ahocorasick
+import orjson
+
+from src.router import UserText
 
 
 DEFAULT_TOP_N = 100
@@ -63,29 +70,82 @@ class SQLPlan:
     safety_notes: List[str]
     suggested_next_inputs: List[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dialect": self.dialect,
+            "query": self.query,
+            "assumptions": self.assumptions,
+            "safety_notes": self.safety_notes,
+            "suggested_next_inputs": self.suggested_next_inputs,
+        }
+
+
+def _is_sensitive(col: str) -> bool:
+    c = col.lower()
+    return any(hint in c for hint in SENSITIVE_COLUMN_HINTS)
+
+
+def _pick_date_column(cols: List[str]) -> Optional[str]:
+    for preferred in ["CreatedDate", "HireDate", "EFFDT", "WorkDate"]:
+        if preferred in cols:
+            return preferred
+
+    for c in cols:
+        if "date" in c.lower():
+            return c
+
+    return None
+
+
+def _index_schema(schema: Dict) -> Dict:
+    """
+    Precomputes per-table lookups once per schema so requests don't redo
+    the lowercasing and sensitive-column checks.
+    """
+    if "tables" not in schema:
+        return schema
+
+    tables: Dict[str, List[str]] = schema["tables"]
+    return {
+        "tables": tables,
+        "tables_lc": [(tn, tn.lower()) for tn in tables],
+        "cols_safe": {tn: [c for c in cols if not _is_sensitive(c)][:12] for tn, cols in tables.items()},
+        "date_col": {tn: _pick_date_column(cols) for tn, cols in tables.items()},
+        "status_col": {tn: next((c for c in cols if c.lower() == "status"), None) for tn, cols in tables.items()},
+    }
+
+
+_REGISTRY_INDEX: Dict[str, Dict] = {name: _index_schema(schema) for name, schema in SCHEMA_REGISTRY.items()}
+
 
 # ✅ SAFE: No file reads → fixes CodeQL issue
 def _load_schema(schema_name: Optional[str]) -> Optional[Dict]:
     if not schema_name:
         return None
-    return SCHEMA_REGISTRY.get(schema_name)
+    return _REGISTRY_INDEX.get(schema_name)
 
 
-def _is_sensitive(col: str) -> bool:
-    c = col.lower()
-    return any(hint in c for hint in SENSITIVE_COLUMN_HINTS)
+# CLI only (--schema): the API never passes a path, so registry lookups stay file-free
+def _load_schema_file(schema_path: str) -> Dict:
+    st = os.stat(schema_path)
+    return _load_schema_file_cached(schema_path, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_schema_file_cached(schema_path: str, mtime_ns: int) -> Dict:
+    # mtime_ns is part of the key so an edited file is re-parsed
+    with open(schema_path, "rb") as f:
+        return _index_schema(orjson.loads(f.read()))
 
 
-def _choose_table(text: str, schema: Optional[Dict]) -> Tuple[str, List[str]]:
+def _choose_table(t: str, schema: Optional[Dict]) -> Tuple[str, List[str]]:
     if not schema or "tables" not in schema:
         return "dbo.YourTable", ["*"]
 
     tables: Dict[str, List[str]] = schema["tables"]
-    t = text.lower()
 
     candidates: List[str] = []
-    for table_name in tables.keys():
-        name_l = table_name.lower()
+    for table_name, name_l in schema["tables_lc"]:
         if "employee" in t and "employee" in name_l:
             candidates.append(table_name)
         elif "department" in t and "department" in name_l:
@@ -99,31 +159,45 @@ def _choose_table(text: str, schema: Optional[Dict]) -> Tuple[str, List[str]]:
     return table, cols
 
 
-def _pick_date_column(cols: List[str]) -> Optional[str]:
-    for preferred in ["CreatedDate", "HireDate", "EFFDT", "WorkDate"]:
-        if preferred in cols:
-            return preferred
+def _active_clause(status_col: Optional[str], date_col: Optional[str]) -> Optional[str]:
+    return f"{status_col} = 'ACTIVE'" if status_col else None
 
-    for c in cols:
-        if "date" in c.lower():
-            return c
 
-    return None
+def _last_90_days_clause(status_col: Optional[str], date_col: Optional[str]) -> Optional[str]:
+    return f"{date_col} >= DATEADD(DAY, -90, GETDATE())" if date_col else None
 
 
-def _build_where(text: str, cols: List[str]) -> str:
-    t = text.lower()
-    clauses: List[str] = []
+# Clause generators in output order; trigger phrases map onto them so synonyms dedupe
+_WHERE_CLAUSES: Tuple[Callable[[Optional[str], Optional[str]], Optional[str]], ...] = (
+    _active_clause,
+    _last_90_days_clause,
+)
+
+_WHERE_TRIGGERS: Dict[str, int] = {
+    "active": 0,
+    "last 90 days": 1,
+    "past 90 days": 1,
+}
+
+
+def _build_where_automaton() -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for phrase, clause_idx in _WHERE_TRIGGERS.items():
+        automaton.add_word(phrase, clause_idx)
+    automaton.make_automaton()
+    return automaton
 
-    status_col = next((c for c in cols if c.lower() == "status"), None)
 
-    if "active" in t and status_col:
-        clauses.append(f"{status_col} = 'ACTIVE'")
+_WHERE_AUTOMATON = _build_where_automaton()
 
-    if "last 90 days" in t:
-        dt_col = _pick_date_column(cols)
-        if dt_col:
-            clauses.append(f"{dt_col} >= DATEADD(DAY, -90, GETDATE())")
+
+def _build_where(t: str, status_col: Optional[str], date_col: Optional[str]) -> str:
+    clauses: List[str] = []
+
+    for clause_idx in sorted({idx for _, idx in _WHERE_AUTOMATON.iter(t)}):
+        clause = _WHERE_CLAUSES[clause_idx](status_col, date_col)
+        if clause:
+            clauses.append(clause)
 
     if not clauses:
         return ""
@@ -141,31 +215,30 @@ def _assert_safe_read_only_sql(query: str) -> None:
 
 
 def generate_safe_sql(
-    user_text: str,
+    user_text: Union[str, UserText],
     top_n: int = DEFAULT_TOP_N,
     schema_name: Optional[str] = None,
+    schema_path: Optional[str] = None,
 ) -> SQLPlan:
     """
     Production-safe SQL generator:
-    - Uses schema registry (NOT file paths)
+    - Uses schema registry (NOT file paths) for API requests
+    - Accepts a local schema file path for CLI use only
     - Enforces read-only queries
     - Applies TOP limits
+    Helpers take lowercased text; pass a UserText to reuse the caller's lowercasing.
     """
+    t = user_text.lower if isinstance(user_text, UserText) else user_text.lower()
 
-    schema = _load_schema(schema_name)
-    table, cols = _choose_table(user_text, schema)
+    schema = _load_schema_file(schema_path) if schema_path else _load_schema(schema_name)
+    table, cols = _choose_table(t, schema)
 
     if cols == ["*"]:
         select_cols = ["*"]
+        where_clause = ""
     else:
-        safe_cols = [c for c in cols if not _is_sensitive(c)]
-
-        if len(safe_cols) > 12:
-            safe_cols = safe_cols[:12]
-
-        select_cols = safe_cols if safe_cols else ["*"]
-
-    where_clause = "" if cols == ["*"] else _build_where(user_text, cols)
+        select_cols = schema["cols_safe"][table] or ["*"]
+        where_clause = _build_where(t, schema["status_col"][table], schema["date_col"][table])
 
     select_list = ",\n    ".join(select_cols)
 
@@ -182,8 +255,8 @@ FROM {table}
         f"Row limit applied using TOP ({top_n}).",
     ]
 
-    if schema_name:
-        assumptions.append(f"Schema used: {schema_name}")
+    if schema_name or schema_path:
+        assumptions.append(f"Schema used: {schema_name or schema_path}")
     else:
         assumptions.append("No schema provided; placeholders may exist.")
 